@@ -8,6 +8,10 @@ from dataclasses import dataclass
 from .company_ats import CompanyATS, ATSProfile
 import re
 
+# Job-description keyword extraction, compiled and built once at import
+_JD_WORD_RE = re.compile(r"[A-Za-z]+")
+_JD_STOPWORDS = frozenset({"and", "the", "to", "of", "in", "for", "with", "on", "at", "by"})
+
 
 @dataclass
 class AnalysisResult:
@@ -121,17 +125,18 @@ class ResumeAnalyzer:
     ) -> Dict:
         """Compare resume keywords with ATS/company requirements and job description."""
         company_keywords = ats_profile.required_keywords
-        resume_text = " ".join([sec.get("text", "") for sec in resume_data["sections"].values()])
+        # Lowercase the joined section text once rather than once per keyword check
+        resume_text = " ".join([sec.get("text", "") for sec in resume_data["sections"].values()]).lower()
 
-        matched_company_keywords = [kw for kw in company_keywords if kw.lower() in resume_text.lower()]
-        missing_company_keywords = [kw for kw in company_keywords if kw.lower() not in resume_text.lower()]
+        matched_company_keywords = [kw for kw in company_keywords if kw.lower() in resume_text]
+        missing_company_keywords = [kw for kw in company_keywords if kw.lower() not in resume_text]
 
         jd_skill_match_percentage = None
         missing_jd_skills = []
         if job_description:
             jd_keywords = self._extract_keywords_from_jd(job_description)
-            matched_jd = [kw for kw in jd_keywords if kw.lower() in resume_text.lower()]
-            missing_jd_skills = [kw for kw in jd_keywords if kw.lower() not in resume_text.lower()]
+            matched_jd = [kw for kw in jd_keywords if kw.lower() in resume_text]
+            missing_jd_skills = [kw for kw in jd_keywords if kw.lower() not in resume_text]
             if jd_keywords:
                 jd_skill_match_percentage = (len(matched_jd) / len(jd_keywords)) * 100
 
@@ -147,9 +152,8 @@ class ResumeAnalyzer:
 
     def _extract_keywords_from_jd(self, job_description: str) -> List[str]:
         """Naive keyword extraction from job description."""
-        words = re.findall(r"[A-Za-z]+", job_description)
-        stopwords = {"and", "the", "to", "of", "in", "for", "with", "on", "at", "by"}
-        return [w for w in words if w.lower() not in stopwords and len(w) > 2]
+        words = _JD_WORD_RE.findall(job_description)
+        return [w for w in words if len(w) > 2 and w.lower() not in _JD_STOPWORDS]
 
     def _generate_recommendations(
         self,
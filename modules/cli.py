@@ -0,0 +1,36 @@
+"""
+CLI Module
+Interactive console prompts used by the ATS simulation demos
+"""
+
+from typing import List
+
+
+def choose_scoring_mode() -> str:
+    """Prompt for scoring mode"""
+    while True:
+        print("\nChoose ATS scoring mode:")
+        print("1 - Rule-based")
+        print("2 - Smart (ML-simulated)")
+        choice = input("Enter choice: ").strip()
+        if choice == "1":
+            return "rule"
+        elif choice == "2":
+            return "smart"
+        else:
+            print("Invalid choice. Please enter 1 or 2.")
+
+
+def choose_company(companies: List[str]) -> str:
+    """Prompt for company selection from the given company names"""
+    print("\nSelect company:")
+    for idx, comp in enumerate(companies, 1):
+        print(f"{idx} - {comp}")
+    while True:
+        try:
+            choice = int(input("Enter company number: ").strip())
+            if 1 <= choice <= len(companies):
+                return companies[choice - 1]
+        except ValueError:
+            pass
+        print("Invalid choice. Please enter a valid number.")
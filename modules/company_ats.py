@@ -3,12 +3,126 @@ Company ATS Simulation Module
 Supports Rule-based and Smart (ML-simulated) scoring
 """
 
-from typing import Dict, List, Set
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from operator import itemgetter, mul
+from types import MappingProxyType
+import bisect
+import copy
+import hashlib
 import re
-
-
-@dataclass
+import sys
+
+from . import cli
+
+
+# ==================== TEXT SCANNING PATTERNS ====================
+# Compiled once with re.IGNORECASE so the text helpers can scan the resume
+# as-is instead of allocating a lowercased copy on every call.
+_COMMON_SKILLS = (
+    'python', 'java', 'javascript', 'c++', 'sql', 'html', 'css', 'react', 'angular',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'linux', 'mongodb',
+    'machine learning', 'ai', 'data science', 'analytics', 'project management',
+    'agile', 'scrum', 'devops', 'testing', 'automation', 'cloud computing'
+)
+# Bound ``search`` methods, so the skill loop does no attribute lookups.
+_COMMON_SKILL_SEARCHES = tuple(
+    (skill, re.compile(re.escape(skill), re.IGNORECASE).search) for skill in _COMMON_SKILLS
+)
+
+# Year-count phrasings, matched against the lowercased text. "N years of
+# experience" and "N years in" share a pass: both start at the number and end
+# differently, so neither can hide a larger count from the other.
+# "experience ... N years" can overlap them and gets its own pass.
+_EXPERIENCE_YEARS_RE = re.compile(
+    r'(\d+)\+?\s*years?\s+(?:of\s+)?experience'
+    r'|(\d+)\+?\s*years?\s+in'
+)
+_EXPERIENCE_THEN_YEARS_RE = re.compile(r'experience.*?(\d+)\+?\s*years?')
+
+_EDUCATION_LEVEL_PATTERNS = (
+    ('phd', re.compile(r'phd|ph\.d|doctorate|doctoral', re.IGNORECASE)),
+    ('masters', re.compile(r'masters|master|mba|m\.s|m\.a', re.IGNORECASE)),
+    ('bachelors', re.compile(r'bachelor|b\.s|b\.a|b\.tech|b\.e', re.IGNORECASE)),
+)
+
+_SECTION_PATTERNS = (
+    ('experience', re.compile(r'experience|work history|employment|professional', re.IGNORECASE)),
+    ('education', re.compile(r'education|academic|university|college|degree', re.IGNORECASE)),
+    ('skills', re.compile(r'skills|technical skills|competencies|proficiencies', re.IGNORECASE)),
+    ('summary', re.compile(r'summary|objective|profile|about', re.IGNORECASE)),
+)
+
+# Company-specific advice attached to every ATS result
+_COMPANY_ADVICE: Dict[str, Tuple[str, ...]] = {
+    'Amazon': ("Emphasize leadership principles", "Include system scalability metrics", "Highlight customer obsession examples"),
+    'Google': ("Highlight algorithmic work", "Add research/publications if any", "Show innovation and impact metrics"),
+    'Microsoft': ("Emphasize collaboration and teamwork", "Include cloud/Azure experience", "Show growth mindset examples"),
+    'TCS': ("Show domain expertise", "Add client interaction experience", "Highlight delivery and project management"),
+    'Infosys': ("Emphasize digital transformation projects", "Show consulting experience", "Add automation and innovation examples"),
+    'Wipro': ("Highlight domain knowledge", "Show quality focus", "Add client delivery examples"),
+    'IBM': ("Emphasize enterprise solutions", "Add AI/Watson experience", "Show consulting and transformation projects"),
+    'Accenture': ("Highlight consulting experience", "Show strategy and transformation work", "Add client management examples"),
+    'JP Morgan': ("Emphasize financial domain knowledge", "Add risk management experience", "Show analytical and quantitative skills"),
+    'Goldman Sachs': ("Highlight investment and financial expertise", "Show analytical skills", "Add high-pressure environment experience")
+}
+_DEFAULT_ADVICE = ("Focus on relevant keywords", "Highlight technical skills", "Show project experience")
+
+# ATS recommendation for scores below 40, from 40, from 60 and from 80
+_REC_THRESHOLDS = (40, 60, 80)
+_REC_MESSAGES = (
+    "Very low likelihood of passing ATS screening",
+    "Low likelihood of passing ATS screening",
+    "Moderate likelihood of passing ATS screening",
+    "High likelihood of passing ATS screening",
+)
+
+# Maximum number of (resume, company, mode) results kept by CompanyATS
+_RESULTS_CACHE_SIZE = 1024
+
+# Sort key for (company, score) pairs
+_BY_SCORE = itemgetter(1)
+
+# Punctuation stripped from whitespace-separated tokens before counting them.
+# '.' is only stripped from the end so terms like '.net' survive.
+_TOKEN_PUNCTUATION = ',;:!?()[]{}"\''
+
+# Read-only fallback for resumes without contact_info
+_NO_CONTACT = MappingProxyType({})
+
+# Fixed terms checked by the smart-mode experience heuristics
+_RECENT_YEARS = ('2023', '2024', '2025')
+_LEADERSHIP_KEYWORDS = ('lead', 'manage', 'director', 'senior', 'principal')
+
+# Smart-mode bonus per company: (trigger terms, bonus if any term appears)
+_COMPANY_BONUSES: Dict[str, Tuple[Tuple[str, ...], float]] = {
+    'Amazon': (('cloud',), 5.0),
+    'Google': (('cloud',), 5.0),
+    'Microsoft': (('cloud',), 5.0),
+    'Accenture': (('consulting',), 5.0),
+    'Deloitte': (('consulting',), 5.0),
+    'JP Morgan': (('finance', 'banking', 'investment'), 5.0),
+    'Goldman Sachs': (('finance', 'banking', 'investment'), 5.0),
+}
+_NO_BONUS: Tuple[Tuple[str, ...], float] = ((), 0.0)
+
+# Keywords and the synonyms that earn them partial credit in smart mode
+_SYNONYM_MAP: Dict[str, Tuple[str, ...]] = {
+    "machine learning": ("ml", "deep learning", "artificial intelligence", "ai"),
+    "javascript": ("js", "node.js", "react", "angular", "vue"),
+    "project management": ("pmp", "scrum master", "agile", "kanban"),
+    "cloud computing": ("aws", "azure", "gcp", "google cloud", "cloud"),
+    "ai": ("artificial intelligence", "machine learning", "ml", "neural networks"),
+    "devops": ("ci/cd", "continuous integration", "continuous delivery", "docker", "kubernetes"),
+    "database": ("sql", "mysql", "postgresql", "mongodb", "oracle"),
+    "programming": ("coding", "development", "software engineering"),
+    "leadership": ("management", "team lead", "supervisor", "director"),
+    "analytics": ("data analysis", "business intelligence", "reporting", "metrics")
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ATSProfile:
     """ATS profile for a specific company"""
     company: str
@@ -17,24 +131,71 @@ class ATSProfile:
     education_weight: float
     skills_weight: float
     format_weight: float
-    preferred_keywords: Set[str]
-    required_skills: Set[str]
+    preferred_keywords: FrozenSet[str]
+    required_skills: FrozenSet[str]
     experience_requirements: Dict[str, int]
-    education_preferences: List[str]
+    education_preferences: Tuple[str, ...]
     scoring_strictness: float  # 0.0 to 1.0
-    common_filters: List[str]
-    required_keywords: Set[str] = None  # NEW FIELD
+    common_filters: Tuple[str, ...]
+    required_keywords: FrozenSet[str] = None  # NEW FIELD
+    _pref_len: int = field(init=False, repr=False, compare=False)
+    _req_len: int = field(init=False, repr=False, compare=False)
+    _weights: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _edu_ranks: Tuple[Tuple[str, int], ...] = field(init=False, repr=False, compare=False)
+    _smart_terms: Tuple[str, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        # Normalize once so scorers never lowercase profile terms per resume.
+        # Terms are interned so profiles sharing a keyword share one string.
+        # The profile is frozen, so fields are set through object.__setattr__.
+        preferred_keywords = frozenset(sys.intern(kw.lower()) for kw in self.preferred_keywords)
+        required_skills = frozenset(sys.intern(skill.lower()) for skill in self.required_skills)
         if self.required_keywords is None:
-            self.required_keywords = set(self.preferred_keywords)
+            required_keywords = preferred_keywords
+        else:
+            required_keywords = frozenset(sys.intern(kw.lower()) for kw in self.required_keywords)
+        object.__setattr__(self, 'preferred_keywords', preferred_keywords)
+        object.__setattr__(self, 'required_skills', required_skills)
+        object.__setattr__(self, 'required_keywords', required_keywords)
+        object.__setattr__(self, 'education_preferences', tuple(self.education_preferences))
+        object.__setattr__(self, 'common_filters', tuple(self.common_filters))
+        object.__setattr__(self, '_pref_len', len(preferred_keywords))
+        object.__setattr__(self, '_req_len', len(required_skills))
+        # Same order as the sub-scores passed to CompanyATS._weighted_score
+        object.__setattr__(self, '_weights', (self.keyword_weight, self.experience_weight,
+                                              self.education_weight, self.skills_weight,
+                                              self.format_weight))
+        # (lowercase preference, score) pairs, best-preferred first
+        object.__setattr__(self, '_edu_ranks', tuple(
+            (pref.lower(), 100 - (i * 15)) for i, pref in enumerate(self.education_preferences)
+        ))
+        # Every lowercase term the smart-mode helpers test the resume text for
+        smart_terms = set(preferred_keywords)
+        for kw in preferred_keywords:
+            smart_terms.update(_SYNONYM_MAP.get(kw, ()))
+        smart_terms.update(required_skills)
+        smart_terms.update(_RECENT_YEARS)
+        smart_terms.update(_LEADERSHIP_KEYWORDS)
+        smart_terms.update(_COMPANY_BONUSES.get(self.company, _NO_BONUS)[0])
+        object.__setattr__(self, '_smart_terms', tuple(smart_terms))
 
 class CompanyATS:
     """Main ATS simulation class with rule-based and smart scoring modes"""
 
+    # Profiles are frozen and carry their own derived tables, so they are built
+    # by the first instance of each class and shared by its later instances.
+    # Keyed by class so a subclass overriding _initialize_ats_profiles gets its own.
+    _shared_profiles: Dict[type, Dict[str, ATSProfile]] = {}
+
     def __init__(self):
-        self.ats_profiles = self._initialize_ats_profiles()
+        profiles = CompanyATS._shared_profiles.get(type(self))
+        if profiles is None:
+            profiles = CompanyATS._shared_profiles[type(self)] = self._initialize_ats_profiles()
+        # Per-instance copy so adding or replacing a profile does not leak across instances
+        self.ats_profiles = dict(profiles)
         self.synonym_map = self._build_synonym_map()
+        self._synonym_index = self._invert_synonym_map(self.synonym_map)
+        self._results_cache: OrderedDict = OrderedDict()
 
     def get_available_companies(self) -> List[str]:
         """Get list of available companies"""
@@ -42,32 +203,11 @@ class CompanyATS:
 
     def choose_scoring_mode(self) -> str:
         """Prompt for scoring mode"""
-        while True:
-            print("\nChoose ATS scoring mode:")
-            print("1 - Rule-based")
-            print("2 - Smart (ML-simulated)")
-            choice = input("Enter choice: ").strip()
-            if choice == "1":
-                return "rule"
-            elif choice == "2":
-                return "smart"
-            else:
-                print("Invalid choice. Please enter 1 or 2.")
+        return cli.choose_scoring_mode()
 
     def choose_company(self) -> str:
         """Prompt for company selection"""
-        companies = self.get_available_companies()
-        print("\nSelect company:")
-        for idx, comp in enumerate(companies, 1):
-            print(f"{idx} - {comp}")
-        while True:
-            try:
-                choice = int(input("Enter company number: ").strip())
-                if 1 <= choice <= len(companies):
-                    return companies[choice - 1]
-            except ValueError:
-                pass
-            print("Invalid choice. Please enter a valid number.")
+        return cli.choose_company(self.get_available_companies())
 
     def get_ats_profile(self, company: str) -> ATSProfile:
         """Get ATS profile for a specific company"""
@@ -89,6 +229,10 @@ class CompanyATS:
         if not isinstance(resume_data, dict):
             raise ValueError("resume_data must be a dictionary")
 
+        return self._simulate_prepared(self._prepare(resume_data), company, mode)
+
+    def _simulate_prepared(self, resume_data: Dict, company: str, mode: str) -> Dict:
+        """simulate_ats_filtering for resume data already passed through _prepare"""
         # Fallback to Generic profile if company not found
         if company not in self.ats_profiles:
             print(f"Warning: Company '{company}' not found. Using Generic profile.")
@@ -102,6 +246,20 @@ class CompanyATS:
         # Load ATS profile for the company
         ats_profile = self.get_ats_profile(company)
 
+        # Reuse the result of an identical earlier call. The key holds the profile's
+        # id rather than the company name, so replacing a profile misses the cache;
+        # each cached result keeps its profile alive, so the id cannot be reused.
+        fingerprint = resume_data['_fingerprint']
+        cache_key = (fingerprint, id(ats_profile), mode) if fingerprint is not None else None
+        if cache_key in self._results_cache:
+            self._results_cache.move_to_end(cache_key)
+            return self._copy_results(self._results_cache[cache_key])
+
+        # Lowercase the text once for all scoring helpers (and for the other mode
+        # or company when the prepared data is reused)
+        if '_text_lower' not in resume_data:
+            resume_data['_text_lower'] = resume_data.get('raw_text', '').lower()
+
         # Run selected analysis mode
         if mode == "rule":
             results = self._simulate_rule_based(resume_data, ats_profile)
@@ -135,8 +293,77 @@ class CompanyATS:
 
         # ALWAYS attach the profile object for downstream modules (analyzer expects it)
         results["ats_profile"] = ats_profile
+
+        if cache_key is not None:
+            self._results_cache[cache_key] = self._copy_results(results)
+            if len(self._results_cache) > _RESULTS_CACHE_SIZE:
+                self._results_cache.popitem(last=False)
         return results
 
+    def simulate_ats_filtering_both(self, resume_data: Dict, company: str = "Generic") -> Dict[str, Dict]:
+        """
+        Simulate ATS filtering in both modes for the same resume
+
+        The resume is prepared once, so the lowercased text, tokens and
+        fingerprint built for the first mode are reused by the second.
+
+        Args:
+            resume_data (Dict): Resume data to analyze
+            company (str): Company name (default: "Generic")
+
+        Returns:
+            Dict[str, Dict]: Results keyed by mode ('rule' and 'smart')
+        """
+        if not isinstance(resume_data, dict):
+            raise ValueError("resume_data must be a dictionary")
+
+        # Resolve the company once so an unknown name is only warned about once
+        if company not in self.ats_profiles:
+            print(f"Warning: Company '{company}' not found. Using Generic profile.")
+            company = "Generic"
+        prepared = self._prepare(resume_data)
+        return {mode: self._simulate_prepared(prepared, company, mode) for mode in ("rule", "smart")}
+
+    def _prepare(self, resume_data: Dict) -> Dict:
+        """
+        Return a shallow copy of resume_data with the derived views the scoring
+        helpers read, so the caller's dict is never modified:
+        '_skills_lower' (lowercased skills), '_has_email' (whether contact_info
+        holds an email) and '_fingerprint' (the results cache key). The helpers
+        add '_text_lower' and the token counts to the same copy on first use.
+        """
+        prepared = dict(resume_data)
+        prepared['_skills_lower'] = frozenset(skill.lower() for skill in resume_data.get('skills', []))
+        prepared['_has_email'] = bool(resume_data.get('contact_info', _NO_CONTACT).get('email'))
+        prepared['_fingerprint'] = self._resume_fingerprint(prepared)
+        return prepared
+
+    def _resume_fingerprint(self, resume_data: Dict) -> Optional[Tuple]:
+        """
+        Build a hashable key from every resume field the scorers read.
+        Returns None when a field is unhashable, which disables caching for the call.
+        """
+        resume_text = resume_data.get('raw_text', '')
+        try:
+            fingerprint = (
+                hashlib.blake2b(resume_text.encode(), digest_size=16).digest(),
+                resume_data['_skills_lower'],
+                resume_data.get('experience_years', 0),
+                resume_data.get('education_level', 'unknown'),
+                frozenset(resume_data.get('sections', {})),
+                resume_data['_has_email'],
+            )
+            hash(fingerprint)
+        except TypeError:
+            return None
+        return fingerprint
+
+    def _copy_results(self, results: Dict) -> Dict:
+        """Copy a results dict so cached entries are not changed by callers"""
+        copied = dict(results)
+        copied["company_specific_notes"] = list(copied["company_specific_notes"])
+        return copied
+
     # ==================== RULE-BASED SCORING ====================
     def _simulate_rule_based(self, resume_data: Dict, profile: ATSProfile) -> Dict:
         """Original rule-based scoring"""
@@ -147,12 +374,8 @@ class CompanyATS:
         skills_score = self._match_skills(resume_data, profile)
         format_score = self._evaluate_format(resume_data, profile)
 
-        overall_score = (
-            keyword_score * profile.keyword_weight +
-            experience_score * profile.experience_weight +
-            education_score * profile.education_weight +
-            skills_score * profile.skills_weight +
-            format_score * profile.format_weight
+        overall_score = self._weighted_score(
+            profile, (keyword_score, experience_score, education_score, skills_score, format_score)
         )
         adjusted_score = overall_score * (1 - profile.scoring_strictness * 0.2)
 
@@ -175,32 +398,31 @@ class CompanyATS:
         """
         passes_initial = self._initial_screening(resume_data, profile)
 
+        # One scan of the text for every term the smart heuristics look for
+        found_terms = self._scan_smart_terms(resume_data, profile)
+
         # More granular keyword scoring with synonyms
-        keyword_score = self._calculate_smart_keyword_score(resume_data, profile)
+        keyword_score = self._calculate_smart_keyword_score(resume_data, profile, found_terms)
 
         # Experience scoring with recency boost
-        experience_score = self._evaluate_smart_experience(resume_data, profile)
+        experience_score = self._evaluate_smart_experience(resume_data, profile, found_terms)
 
         # Education score with tier matching
         education_score = self._assess_smart_education(resume_data, profile)
 
         # Skills score with partial matching
-        skills_score = self._match_smart_skills(resume_data, profile)
+        skills_score = self._match_smart_skills(resume_data, profile, found_terms)
 
         # Format score with completeness bonus
         format_score = self._evaluate_smart_format(resume_data, profile)
 
         # Weighted final score with smart adjustments
-        overall_score = (
-            keyword_score * profile.keyword_weight +
-            experience_score * profile.experience_weight +
-            education_score * profile.education_weight +
-            skills_score * profile.skills_weight +
-            format_score * profile.format_weight
+        overall_score = self._weighted_score(
+            profile, (keyword_score, experience_score, education_score, skills_score, format_score)
         )
 
         # Apply company-specific smart adjustments
-        overall_score = self._apply_smart_adjustments(overall_score, resume_data, profile)
+        overall_score = self._apply_smart_adjustments(overall_score, resume_data, profile, found_terms)
         adjusted_score = min(overall_score * (1 - profile.scoring_strictness * 0.15), 100)
 
         return {
@@ -216,43 +438,71 @@ class CompanyATS:
         }
 
     # ==================== HELPER FUNCTIONS ====================
+    def _weighted_score(self, profile: ATSProfile, scores: Tuple[float, ...]) -> float:
+        """Combine (keyword, experience, education, skills, format) scores with the profile weights"""
+        return sum(map(mul, scores, profile._weights))
+
+    def _scan_smart_terms(self, resume_data: Dict, profile: ATSProfile) -> Set[str]:
+        """Return the smart-mode terms that occur in the resume text"""
+        resume_text = resume_data['_text_lower']
+        return {term for term in profile._smart_terms if term in resume_text}
+
     def _initial_screening(self, resume_data: Dict, profile: ATSProfile) -> bool:
         """Basic initial screening checks"""
         return (
-            bool(resume_data.get('contact_info', {}).get('email')) and
+            resume_data['_has_email'] and
             len(resume_data.get('raw_text', '')) > 100 and
-            len(resume_data.get('skills', [])) > 0
+            bool(resume_data['_skills_lower'])
         )
 
+    def _tokenize_and_count(self, resume_data: Dict) -> Tuple[Counter, int]:
+        """
+        Tokenize the lowercased resume text once and keep the token counts and
+        word count on the prepared resume data for the other helpers.
+        """
+        if '_token_counts' not in resume_data:
+            tokens = resume_data['_text_lower'].split()
+            resume_data['_token_counts'] = Counter(
+                token.strip(_TOKEN_PUNCTUATION).rstrip('.') for token in tokens
+            )
+            resume_data['_n_tokens'] = len(tokens)
+        return resume_data['_token_counts'], resume_data['_n_tokens']
+
     def _calculate_keyword_score(self, resume_data: Dict, profile: ATSProfile) -> float:
         """Calculate keyword matching score (rule-based)"""
-        resume_text = resume_data.get('raw_text', '').lower()
-        matched_keywords = sum(1 for kw in profile.preferred_keywords
-                               if kw.lower() in resume_text)
-        return (matched_keywords / len(profile.preferred_keywords) * 100) if profile.preferred_keywords else 0
+        resume_text = resume_data['_text_lower']
+        matched_keywords = sum(1 for kw in profile.preferred_keywords if kw in resume_text)
+        return (matched_keywords / profile._pref_len * 100) if profile._pref_len else 0
 
-    def _calculate_smart_keyword_score(self, resume_data: Dict, profile: ATSProfile) -> float:
+    def _calculate_smart_keyword_score(self, resume_data: Dict, profile: ATSProfile,
+                                       found_terms: Set[str] = None) -> float:
         """Calculate keyword matching score with synonyms and context"""
-        resume_text = resume_data.get('raw_text', '').lower()
-        matched_keywords = 0
-
-        for kw in profile.preferred_keywords:
-            if kw.lower() in resume_text:
-                # Full match
-                matched_keywords += 1
-            elif kw.lower() in self.synonym_map:
-                # Synonym match (partial credit)
-                if any(syn in resume_text for syn in self.synonym_map[kw.lower()]):
-                    matched_keywords += 0.8
-
-        # Penalty for keyword stuffing
-        total_words = len(resume_text.split())
+        if found_terms is None:
+            found_terms = self._scan_smart_terms(resume_data, profile)
+        resume_text = resume_data['_text_lower']
+
+        # Keywords credited through any synonym found in the text
+        synonym_hits = set()
+        for term in found_terms:
+            synonym_hits.update(self._synonym_index.get(term, ()))
+
+        # Full match, otherwise synonym match (partial credit)
+        full_matches = profile.preferred_keywords & found_terms
+        matched_keywords = len(full_matches) + 0.8 * len(
+            (profile.preferred_keywords - full_matches) & synonym_hits
+        )
+
+        # Penalty for keyword stuffing. Single-word keywords are counted as whole
+        # tokens, multi-word keywords as substrings; absent keywords count zero.
+        token_counts, total_words = self._tokenize_and_count(resume_data)
         if total_words > 0:
-            keyword_density = sum(resume_text.count(kw.lower()) for kw in profile.preferred_keywords) / total_words
+            keyword_density = sum(resume_text.count(kw) if ' ' in kw else token_counts[kw]
+                                  for kw in profile.preferred_keywords
+                                  if kw in found_terms) / total_words
             if keyword_density > 0.1:  # More than 10% keyword density
                 matched_keywords *= 0.9
 
-        return max((matched_keywords / len(profile.preferred_keywords) * 100), 0) if profile.preferred_keywords else 0
+        return max((matched_keywords / profile._pref_len * 100), 0) if profile._pref_len else 0
 
     def _evaluate_experience(self, resume_data: Dict, profile: ATSProfile) -> float:
         """Evaluate experience level (rule-based)"""
@@ -266,18 +516,19 @@ class CompanyATS:
             return 60
         return 40
 
-    def _evaluate_smart_experience(self, resume_data: Dict, profile: ATSProfile) -> float:
+    def _evaluate_smart_experience(self, resume_data: Dict, profile: ATSProfile,
+                                   found_terms: Set[str] = None) -> float:
         """Evaluate experience with recency and relevance boost"""
+        if found_terms is None:
+            found_terms = self._scan_smart_terms(resume_data, profile)
         base_score = self._evaluate_experience(resume_data, profile)
 
         # Bonus for recent experience
-        resume_text = resume_data.get('raw_text', '')
-        if any(year in resume_text for year in ['2023', '2024', '2025']):
+        if any(year in found_terms for year in _RECENT_YEARS):
             base_score += 5
 
         # Bonus for leadership keywords
-        leadership_keywords = ['lead', 'manage', 'director', 'senior', 'principal']
-        if any(kw in resume_text.lower() for kw in leadership_keywords):
+        if any(kw in found_terms for kw in _LEADERSHIP_KEYWORDS):
             base_score += 10
 
         return min(base_score, 100)
@@ -286,9 +537,9 @@ class CompanyATS:
         """Assess education level (rule-based)"""
         level = resume_data.get('education_level', 'unknown').lower()
 
-        for i, pref in enumerate(profile.education_preferences):
-            if pref.lower() in level:
-                return 100 - (i * 15)  # Higher preference = higher score
+        for pref, score in profile._edu_ranks:
+            if pref in level:
+                return score  # Higher preference = higher score
         return 50  # Default score for unknown/other education
 
     def _assess_smart_education(self, resume_data: Dict, profile: ATSProfile) -> float:
@@ -304,27 +555,29 @@ class CompanyATS:
 
     def _match_skills(self, resume_data: Dict, profile: ATSProfile) -> float:
         """Match required skills (rule-based)"""
-        resume_skills = set(skill.lower() for skill in resume_data.get('skills', []))
-        required_skills = set(skill.lower() for skill in profile.required_skills)
-        matches = len(resume_skills.intersection(required_skills))
-        return (matches / len(required_skills) * 100) if required_skills else 0
+        matches = len(resume_data['_skills_lower'] & profile.required_skills)
+        return (matches / profile._req_len * 100) if profile._req_len else 0
 
-    def _match_smart_skills(self, resume_data: Dict, profile: ATSProfile) -> float:
+    def _match_smart_skills(self, resume_data: Dict, profile: ATSProfile,
+                            found_terms: Set[str] = None) -> float:
         """Match skills with partial matching"""
+        if found_terms is None:
+            found_terms = self._scan_smart_terms(resume_data, profile)
         base_score = self._match_skills(resume_data, profile)
 
-        # Partial matching bonus
-        resume_skills = [skill.lower() for skill in resume_data.get('skills', [])]
-        resume_text = resume_data.get('raw_text', '').lower()
+        # Partial matching bonus. Skills are joined on newlines so each required
+        # skill is one substring scan; a match cannot span two resume skills.
+        resume_skills = resume_data['_skills_lower']
+        skills_blob = '\n'.join(resume_skills)
 
         partial_matches = 0
         for req_skill in profile.required_skills:
-            if any(req_skill.lower() in skill for skill in resume_skills):
+            if resume_skills and req_skill in skills_blob:
                 partial_matches += 0.5
-            elif req_skill.lower() in resume_text:
+            elif req_skill in found_terms:
                 partial_matches += 0.3
 
-        bonus_score = (partial_matches / len(profile.required_skills) * 20) if profile.required_skills else 0
+        bonus_score = (partial_matches / profile._req_len * 20) if profile._req_len else 0
         return min(base_score + bonus_score, 100)
 
     def _evaluate_format(self, resume_data: Dict, profile: ATSProfile) -> float:
@@ -339,7 +592,7 @@ class CompanyATS:
                 score -= 25
 
         # Check for contact information
-        if not resume_data.get('contact_info', {}).get('email'):
+        if not resume_data['_has_email']:
             score -= 30
 
         return max(score, 0)
@@ -354,88 +607,56 @@ class CompanyATS:
             base_score += 10
 
         # Penalty for too short resumes
-        if len(resume_data.get('raw_text', '').split()) < 200:
+        if self._tokenize_and_count(resume_data)[1] < 200:
             base_score -= 15
 
         return max(min(base_score, 100), 0)
 
-    def _apply_smart_adjustments(self, score: float, resume_data: Dict, profile: ATSProfile) -> float:
+    def _apply_smart_adjustments(self, score: float, resume_data: Dict, profile: ATSProfile,
+                                 found_terms: Set[str] = None) -> float:
         """Apply company-specific smart adjustments"""
-        text = resume_data.get('raw_text', '').lower()
-        if (profile.company in ['Amazon', 'Google', 'Microsoft'] and 'cloud' in text):
-            score += 5
-        if (profile.company in ['Accenture', 'Deloitte'] and 'consulting' in text):
-            score += 5
-        if (profile.company in ['JP Morgan', 'Goldman Sachs'] and any(term in text for term in ['finance', 'banking', 'investment'])):
-            score += 5
+        if found_terms is None:
+            found_terms = self._scan_smart_terms(resume_data, profile)
+        terms, bonus = _COMPANY_BONUSES.get(profile.company, _NO_BONUS)
+        if any(term in found_terms for term in terms):
+            score += bonus
         return score
 
     def _get_ats_recommendation(self, score: float) -> str:
         """Get ATS recommendation based on score"""
-        if score >= 80:
-            return "High likelihood of passing ATS screening"
-        elif score >= 60:
-            return "Moderate likelihood of passing ATS screening"
-        elif score >= 40:
-            return "Low likelihood of passing ATS screening"
-        return "Very low likelihood of passing ATS screening"
+        return _REC_MESSAGES[bisect.bisect_right(_REC_THRESHOLDS, score)]
 
     def _get_company_notes(self, resume_data: Dict, profile: ATSProfile) -> List[str]:
         """Get company-specific notes and recommendations"""
-        notes = []
-
-        company_specific_advice = {
-            'Amazon': ["Emphasize leadership principles", "Include system scalability metrics", "Highlight customer obsession examples"],
-            'Google': ["Highlight algorithmic work", "Add research/publications if any", "Show innovation and impact metrics"],
-            'Microsoft': ["Emphasize collaboration and teamwork", "Include cloud/Azure experience", "Show growth mindset examples"],
-            'TCS': ["Show domain expertise", "Add client interaction experience", "Highlight delivery and project management"],
-            'Infosys': ["Emphasize digital transformation projects", "Show consulting experience", "Add automation and innovation examples"],
-            'Wipro': ["Highlight domain knowledge", "Show quality focus", "Add client delivery examples"],
-            'IBM': ["Emphasize enterprise solutions", "Add AI/Watson experience", "Show consulting and transformation projects"],
-            'Accenture': ["Highlight consulting experience", "Show strategy and transformation work", "Add client management examples"],
-            'JP Morgan': ["Emphasize financial domain knowledge", "Add risk management experience", "Show analytical and quantitative skills"],
-            'Goldman Sachs': ["Highlight investment and financial expertise", "Show analytical skills", "Add high-pressure environment experience"]
-        }
-
-        if profile.company in company_specific_advice:
-            notes.extend(company_specific_advice[profile.company])
-        else:
-            notes.extend(["Focus on relevant keywords", "Highlight technical skills", "Show project experience"])
-
-        return notes
+        return list(_COMPANY_ADVICE.get(profile.company, _DEFAULT_ADVICE))
 
     def _build_synonym_map(self) -> Dict[str, List[str]]:
         """Build a map of keywords to their synonyms for smart matching"""
-        return {
-            "machine learning": ["ml", "deep learning", "artificial intelligence", "ai"],
-            "javascript": ["js", "node.js", "react", "angular", "vue"],
-            "project management": ["pmp", "scrum master", "agile", "kanban"],
-            "cloud computing": ["aws", "azure", "gcp", "google cloud", "cloud"],
-            "ai": ["artificial intelligence", "machine learning", "ml", "neural networks"],
-            "devops": ["ci/cd", "continuous integration", "continuous delivery", "docker", "kubernetes"],
-            "database": ["sql", "mysql", "postgresql", "mongodb", "oracle"],
-            "programming": ["coding", "development", "software engineering"],
-            "leadership": ["management", "team lead", "supervisor", "director"],
-            "analytics": ["data analysis", "business intelligence", "reporting", "metrics"]
-        }
+        return {kw: list(synonyms) for kw, synonyms in _SYNONYM_MAP.items()}
+
+    def _invert_synonym_map(self, synonym_map: Dict[str, List[str]]) -> Dict[str, FrozenSet[str]]:
+        """Map each synonym to the keywords it gives partial credit for"""
+        index: Dict[str, Set[str]] = {}
+        for kw, synonyms in synonym_map.items():
+            for syn in synonyms:
+                index.setdefault(syn, set()).add(kw)
+        return {syn: frozenset(kws) for syn, kws in index.items()}
 
     def _initialize_ats_profiles(self) -> Dict[str, ATSProfile]:
         """Initialize ATS profiles for different companies"""
         return {
-             "Generic": ATSProfile(
-            company="Generic",
-            keyword_weight=0.25,
-            experience_weight=0.25,
-            education_weight=0.15,
-            skills_weight=0.2,
-            format_weight=0.15,
-            preferred_keywords={"resume", "experience", "skills"},
-            required_skills={"communication", "teamwork"},
-            experience_requirements={"entry": 0, "mid": 3, "senior": 5},
-            education_preferences=["bachelor", "master", "phd"],
-            scoring_strictness=0.5,
-            common_filters=["pdf", "docx"]
-        ),
+            'Generic': ATSProfile(
+                company='Generic',
+                keyword_weight=0.30, experience_weight=0.25,
+                education_weight=0.20, skills_weight=0.20, format_weight=0.05,
+                preferred_keywords={'programming', 'problem solving', 'teamwork', 'communication',
+                                   'leadership', 'project management'},
+                required_skills={'programming', 'problem solving', 'communication'},
+                experience_requirements={'entry': 0, 'mid': 3, 'senior': 5},
+                education_preferences=('bachelors', 'masters'),
+                scoring_strictness=0.70, common_filters=('skills', 'experience', 'education')
+            ),
+
             'Amazon': ATSProfile(
                 company='Amazon',
                 keyword_weight=0.35, experience_weight=0.25,
@@ -445,8 +666,8 @@ class CompanyATS:
                                    'java', 'python', 'sql', 'data structures', 'algorithms', 'system design'},
                 required_skills={'programming', 'problem solving', 'system design', 'cloud computing', 'databases'},
                 experience_requirements={'entry': 0, 'mid': 3, 'senior': 5, 'principal': 8},
-                education_preferences=['bachelors', 'masters', 'phd'],
-                scoring_strictness=0.8, common_filters=['leadership', 'innovation', 'scale']
+                education_preferences=('bachelors', 'masters', 'phd'),
+                scoring_strictness=0.8, common_filters=('leadership', 'innovation', 'scale')
             ),
 
             'Google': ATSProfile(
@@ -458,8 +679,8 @@ class CompanyATS:
                                    'innovation', 'scalability', 'performance optimization'},
                 required_skills={'programming', 'algorithms', 'data structures', 'system design', 'problem solving'},
                 experience_requirements={'entry': 0, 'mid': 3, 'senior': 5, 'staff': 8},
-                education_preferences=['masters', 'phd', 'bachelors'],
-                scoring_strictness=0.85, common_filters=['innovation', 'research', 'impact']
+                education_preferences=('masters', 'phd', 'bachelors'),
+                scoring_strictness=0.85, common_filters=('innovation', 'research', 'impact')
             ),
 
             'Microsoft': ATSProfile(
@@ -470,8 +691,8 @@ class CompanyATS:
                                    'sharepoint', 'teams', 'cloud computing', 'devops', 'agile'},
                 required_skills={'programming', 'cloud platforms', 'collaboration', 'problem solving'},
                 experience_requirements={'entry': 0, 'mid': 2, 'senior': 5, 'principal': 7},
-                education_preferences=['bachelors', 'masters'],
-                scoring_strictness=0.75, common_filters=['collaboration', 'diversity', 'growth mindset']
+                education_preferences=('bachelors', 'masters'),
+                scoring_strictness=0.75, common_filters=('collaboration', 'diversity', 'growth mindset')
             ),
 
             'TCS': ATSProfile(
@@ -482,8 +703,8 @@ class CompanyATS:
                                    'erp', 'sap', 'mainframe', 'cobol', 'testing', 'qa'},
                 required_skills={'programming', 'database management', 'testing', 'domain knowledge'},
                 experience_requirements={'entry': 0, 'mid': 3, 'senior': 6, 'lead': 8},
-                education_preferences=['bachelors', 'masters'],
-                scoring_strictness=0.70, common_filters=['domain expertise', 'client handling', 'delivery']
+                education_preferences=('bachelors', 'masters'),
+                scoring_strictness=0.70, common_filters=('domain expertise', 'client handling', 'delivery')
             ),
 
             'Infosys': ATSProfile(
@@ -494,8 +715,8 @@ class CompanyATS:
                                    'automation', 'ai', 'machine learning', 'consulting'},
                 required_skills={'programming', 'consulting', 'client interaction', 'problem solving'},
                 experience_requirements={'entry': 0, 'mid': 2, 'senior': 5, 'principal': 8},
-                education_preferences=['bachelors', 'masters'],
-                scoring_strictness=0.72, common_filters=['innovation', 'digital', 'transformation']
+                education_preferences=('bachelors', 'masters'),
+                scoring_strictness=0.72, common_filters=('innovation', 'digital', 'transformation')
             ),
 
             'Wipro': ATSProfile(
@@ -506,8 +727,8 @@ class CompanyATS:
                                    'retail', 'cloud', 'devops', 'sap'},
                 required_skills={'programming', 'domain knowledge', 'testing', 'project management'},
                 experience_requirements={'entry': 0, 'mid': 3, 'senior': 5, 'manager': 7},
-                education_preferences=['bachelors', 'masters'],
-                scoring_strictness=0.68, common_filters=['domain expertise', 'quality', 'delivery']
+                education_preferences=('bachelors', 'masters'),
+                scoring_strictness=0.68, common_filters=('domain expertise', 'quality', 'delivery')
             ),
 
             'IBM': ATSProfile(
@@ -518,8 +739,8 @@ class CompanyATS:
                                    'websphere', 'consulting', 'transformation'},
                 required_skills={'consulting', 'enterprise solutions', 'ai/ml', 'problem solving'},
                 experience_requirements={'entry': 0, 'mid': 3, 'senior': 6, 'executive': 10},
-                education_preferences=['masters', 'phd', 'bachelors'],
-                scoring_strictness=0.78, common_filters=['innovation', 'research', 'enterprise']
+                education_preferences=('masters', 'phd', 'bachelors'),
+                scoring_strictness=0.78, common_filters=('innovation', 'research', 'enterprise')
             ),
 
             'Accenture': ATSProfile(
@@ -530,8 +751,8 @@ class CompanyATS:
                                    'strategy', 'analytics', 'ai', 'automation', 'client'},
                 required_skills={'consulting', 'client management', 'strategy', 'digital transformation'},
                 experience_requirements={'entry': 0, 'mid': 2, 'senior': 4, 'manager': 6},
-                education_preferences=['masters', 'bachelors', 'mba'],
-                scoring_strictness=0.75, common_filters=['consulting', 'strategy', 'transformation']
+                education_preferences=('masters', 'bachelors', 'mba'),
+                scoring_strictness=0.75, common_filters=('consulting', 'strategy', 'transformation')
             ),
 
             'JP Morgan': ATSProfile(
@@ -542,8 +763,8 @@ class CompanyATS:
                                    'trading', 'investment', 'derivatives', 'portfolio'},
                 required_skills={'finance', 'analytics', 'programming', 'risk management'},
                 experience_requirements={'entry': 0, 'mid': 2, 'senior': 5, 'vp': 8},
-                education_preferences=['masters', 'bachelors', 'mba'],
-                scoring_strictness=0.77, common_filters=['finance', 'analytics', 'banking']
+                education_preferences=('masters', 'bachelors', 'mba'),
+                scoring_strictness=0.77, common_filters=('finance', 'analytics', 'banking')
             ),
 
             'Goldman Sachs': ATSProfile(
@@ -554,20 +775,8 @@ class CompanyATS:
                                    'trading', 'derivatives', 'fixed income', 'equity'},
                 required_skills={'finance', 'analytics', 'programming', 'quantitative analysis'},
                 experience_requirements={'entry': 0, 'mid': 3, 'senior': 6, 'md': 10},
-                education_preferences=['masters', 'phd', 'mba'],
-                scoring_strictness=0.80, common_filters=['finance', 'investment', 'analytics']
-            ),
-
-            'Generic': ATSProfile(
-                company='Generic',
-                keyword_weight=0.30, experience_weight=0.25,
-                education_weight=0.20, skills_weight=0.20, format_weight=0.05,
-                preferred_keywords={'programming', 'problem solving', 'teamwork', 'communication',
-                                   'leadership', 'project management'},
-                required_skills={'programming', 'problem solving', 'communication'},
-                experience_requirements={'entry': 0, 'mid': 3, 'senior': 5},
-                education_preferences=['bachelors', 'masters'],
-                scoring_strictness=0.70, common_filters=['skills', 'experience', 'education']
+                education_preferences=('masters', 'phd', 'mba'),
+                scoring_strictness=0.80, common_filters=('finance', 'investment', 'analytics')
             )
         }
 
@@ -587,6 +796,25 @@ class CompanyATS:
             print("🔄 Using default settings (Generic company, rule-based mode)")
             return self.simulate_ats_filtering(resume_data, "Generic", "rule")
 
+    def batch_score(self, resumes: List[Dict], companies: List[str] = None, mode: str = "rule") -> List[List[float]]:
+        """
+        Score many resumes against many companies in one call
+
+        Returns one row per resume and one column per company (all available
+        companies by default) holding the overall ATS score. Each resume's text
+        is lowercased and tokenized once and reused for every company.
+        """
+        if companies is None:
+            companies = self.get_available_companies()
+        rows = []
+        for resume in resumes:
+            if not isinstance(resume, dict):
+                raise ValueError("resume_data must be a dictionary")
+            prepared = self._prepare(resume)
+            rows.append([self._simulate_prepared(prepared, company, mode)['overall_ats_score']
+                         for company in companies])
+        return rows
+
     def simple_score(self, resume_text: str, company: str = "Generic") -> float:
         """
         Simplified scoring method that only needs resume text
@@ -616,61 +844,28 @@ class CompanyATS:
 
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract likely skills from resume text"""
-        common_skills = [
-            'python', 'java', 'javascript', 'c++', 'sql', 'html', 'css', 'react', 'angular',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'linux', 'mongodb',
-            'machine learning', 'ai', 'data science', 'analytics', 'project management',
-            'agile', 'scrum', 'devops', 'testing', 'automation', 'cloud computing'
-        ]
-
-        text_lower = text.lower()
-        found_skills = [skill for skill in common_skills if skill in text_lower]
-        return found_skills[:10]  # Limit to top 10 matches
+        found_skills = [skill for skill, search in _COMMON_SKILL_SEARCHES if search(text)]
+        # Order-preserving dedup in case the skill table ever repeats an entry
+        return list(dict.fromkeys(found_skills))[:10]  # Limit to top 10 matches
 
     def _estimate_experience_years(self, text: str) -> int:
         """Estimate years of experience from resume text"""
-        year_patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            r'(\d+)\+?\s*years?\s+in',
-            r'experience.*?(\d+)\+?\s*years?',
-        ]
-
-        years = []
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text.lower())
-            years.extend([int(match) for match in matches])
-
+        text_lower = text.lower()
+        years = [int(group) for match in _EXPERIENCE_YEARS_RE.finditer(text_lower)
+                 for group in match.groups() if group]
+        years.extend(map(int, _EXPERIENCE_THEN_YEARS_RE.findall(text_lower)))
         return max(years) if years else 2  # Default to 2 years
 
     def _detect_education_level(self, text: str) -> str:
         """Detect education level from resume text"""
-        text_lower = text.lower()
-
-        if any(term in text_lower for term in ['phd', 'ph.d', 'doctorate', 'doctoral']):
-            return 'phd'
-        elif any(term in text_lower for term in ['masters', 'master', 'mba', 'm.s', 'm.a']):
-            return 'masters'
-        elif any(term in text_lower for term in ['bachelor', 'b.s', 'b.a', 'b.tech', 'b.e']):
-            return 'bachelors'
-        else:
-            return 'bachelors'  # Default assumption
+        for level, pattern in _EDUCATION_LEVEL_PATTERNS:
+            if pattern.search(text):
+                return level
+        return 'bachelors'  # Default assumption
 
     def _detect_sections(self, text: str) -> Dict[str, bool]:
         """Detect which sections are present in resume"""
-        text_lower = text.lower()
-
-        sections = {}
-        section_keywords = {
-            'experience': ['experience', 'work history', 'employment', 'professional'],
-            'education': ['education', 'academic', 'university', 'college', 'degree'],
-            'skills': ['skills', 'technical skills', 'competencies', 'proficiencies'],
-            'summary': ['summary', 'objective', 'profile', 'about']
-        }
-
-        for section, keywords in section_keywords.items():
-            sections[section] = any(keyword in text_lower for keyword in keywords)
-
-        return sections
+        return {section: bool(pattern.search(text)) for section, pattern in _SECTION_PATTERNS}
 
     def run_ats_simulation(self, resume_data: Dict = None, company: str = None, mode: str = None) -> Dict:
         """
@@ -717,56 +912,66 @@ class CompanyATS:
 
 # ==================== Top-level helper functions for convenience ====================
 
-def test_specific_company(company_name: str = "Amazon", mode: str = "smart"):
-    """Test ATS simulation for a specific company and mode"""
-    ats = CompanyATS()
+# Shared by the demo helpers below; it also keeps their results cache warm
+_ATS = CompanyATS()
 
-    sample_resume = {
-        'contact_info': {'email': 'john.doe@example.com'},
-        'raw_text': '''Senior Software Engineer with 8 years of experience in distributed systems,
+# Sample resume templates for the demos; each call works on its own deep copy
+_SAMPLE_RESUME_SDE = {
+    'contact_info': {'email': 'john.doe@example.com'},
+    'raw_text': '''Senior Software Engineer with 8 years of experience in distributed systems,
         cloud computing, and machine learning. Proficient in Java, Python, AWS, microservices architecture.
         Led multiple teams and delivered scalable solutions serving millions of customers. Experience with
         system design, algorithms, data structures, and performance optimization. Strong background in
         leadership principles and customer obsession.''',
-        'skills': ['Java', 'Python', 'AWS', 'Machine Learning', 'System Design', 'Microservices',
-                  'Leadership', 'Algorithms', 'Data Structures'],
-        'experience_years': 8,
-        'education_level': 'masters',
-        'sections': {'experience': True, 'education': True, 'skills': True, 'summary': True}
-    }
+    'skills': ('Java', 'Python', 'AWS', 'Machine Learning', 'System Design', 'Microservices',
+              'Leadership', 'Algorithms', 'Data Structures'),
+    'experience_years': 8,
+    'education_level': 'masters',
+    'sections': {'experience': True, 'education': True, 'skills': True, 'summary': True}
+}
+
+_SAMPLE_RESUME_DS = {
+    'contact_info': {'email': 'alice.smith@example.com'},
+    'raw_text': '''Data Scientist with 6 years of experience in machine learning, artificial intelligence,
+        and big data analytics. Expert in Python, TensorFlow, algorithms, and statistical modeling.
+        Published research papers and contributed to open-source ML projects. Experience with distributed
+        systems, cloud platforms (GCP), and performance optimization.''',
+    'skills': ('Python', 'Machine Learning', 'TensorFlow', 'Algorithms', 'Statistics',
+              'Research', 'GCP', 'Data Analysis'),
+    'experience_years': 6,
+    'education_level': 'phd',
+    'sections': {'experience': True, 'education': True, 'skills': True, 'summary': True}
+}
+
+
+def test_specific_company(company_name: str = "Amazon", mode: str = "smart", resume: Dict = None):
+    """Test ATS simulation for a specific company and mode"""
+    ats = _ATS
+    if resume is None:
+        resume = copy.deepcopy(_SAMPLE_RESUME_SDE)
 
     print(f"=== Testing {company_name} - {mode.upper()} Mode ===")
-    results = ats.simulate_ats_filtering(sample_resume, company_name, mode)
+    results = ats.simulate_ats_filtering(resume, company_name, mode)
     ats.display_results(results, company_name, mode)
     return results
 
 
-def compare_modes(company_name: str = "Google"):
+def compare_modes(company_name: str = "Google", resume: Dict = None):
     """Compare rule-based vs smart mode for the same company"""
-    ats = CompanyATS()
-
-    sample_resume = {
-        'contact_info': {'email': 'alice.smith@example.com'},
-        'raw_text': '''Data Scientist with 6 years of experience in machine learning, artificial intelligence,
-        and big data analytics. Expert in Python, TensorFlow, algorithms, and statistical modeling.
-        Published research papers and contributed to open-source ML projects. Experience with distributed
-        systems, cloud platforms (GCP), and performance optimization.''',
-        'skills': ['Python', 'Machine Learning', 'TensorFlow', 'Algorithms', 'Statistics',
-                  'Research', 'GCP', 'Data Analysis'],
-        'experience_years': 6,
-        'education_level': 'phd',
-        'sections': {'experience': True, 'education': True, 'skills': True, 'summary': True}
-    }
+    ats = _ATS
+    if resume is None:
+        resume = copy.deepcopy(_SAMPLE_RESUME_DS)
 
     print(f"=== COMPARING MODES FOR {company_name} ===")
+    results = ats.simulate_ats_filtering_both(resume, company_name)
 
     # Test rule-based
-    rule_results = ats.simulate_ats_filtering(sample_resume, company_name, 'rule')
+    rule_results = results['rule']
     print("\n🔧 RULE-BASED MODE:")
     print(f"Overall Score: {rule_results['overall_ats_score']}/100")
 
     # Test smart mode
-    smart_results = ats.simulate_ats_filtering(sample_resume, company_name, 'smart')
+    smart_results = results['smart']
     print("\n🧠 SMART MODE:")
     print(f"Overall Score: {smart_results['overall_ats_score']}/100")
 
@@ -775,12 +980,13 @@ def compare_modes(company_name: str = "Google"):
 
 def interactive_demo():
     """Run interactive demo of the ATS system"""
-    ats = CompanyATS()
+    ats = _ATS
 
     print("🚀 Starting Interactive ATS Simulation Demo...")
     print("\nUsing sample resume data for demonstration.")
 
-    # Run the full interactive simulation
+    # Run the full interactive simulation. Repeat choices are served by the
+    # instance's results cache, since the sample resume never changes.
     results = ats.run_ats_simulation()
 
     # Ask if user wants to try another combination
@@ -917,6 +1123,13 @@ def compare_companies(resume_text: str, companies: List[str] = None) -> Dict[str
     return results
 
 
+def compare_companies_sorted(resume_text: str, companies: List[str] = None) -> List[Tuple[str, float]]:
+    """
+    Compare ATS scores across multiple companies, highest score first
+    """
+    return sorted(compare_companies(resume_text, companies).items(), key=_BY_SCORE, reverse=True)
+
+
 def test_all_error_cases():
     """Test all possible error scenarios"""
     print("🧪 TESTING ALL ERROR CASES")
@@ -975,9 +1188,9 @@ def main():
         score = easy_ats_score("Senior Software Engineer with 5+ years experience in Python, Java, AWS, and machine learning")
         print(f"✅ Sample ATS Score: {score}/100")
 
-        comparison = compare_companies("Data scientist with PhD and machine learning expertise", ["Google", "Amazon", "Microsoft"])
+        comparison = compare_companies_sorted("Data scientist with PhD and machine learning expertise", ["Google", "Amazon", "Microsoft"])
         print("\n🏢 Company Comparison:")
-        for company, score in sorted(comparison.items(), key=lambda x: x[1], reverse=True):
+        for company, score in comparison:
             print(f"   {company}: {score}/100")
 
     except Exception as e:
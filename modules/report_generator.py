@@ -3,166 +3,182 @@ Report Generator Module
 Generates detailed analysis reports and displays results
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, TextIO
 import datetime
+import io
 import sys
 import dataclasses
 
+# Finished bar strings indexed by filled length, for 0-100 scores
+_SCORE_BAR_LENGTH = 30
+_MINI_BAR_LENGTH = 10
+_SCORE_BARS = tuple("█" * i + "░" * (_SCORE_BAR_LENGTH - i) for i in range(_SCORE_BAR_LENGTH + 1))
+_MINI_BARS = tuple("█" * i + "░" * (_MINI_BAR_LENGTH - i) for i in range(_MINI_BAR_LENGTH + 1))
+
 class ReportGenerator:
     def __init__(self):
         self.report_template = self._load_report_template()
     
     def display_report(self, analysis_result):
         """Display comprehensive analysis report"""
+        sys.stdout.write(self.render_report(analysis_result))
+
+    def render_report(self, analysis_result) -> str:
+        """Render the full report into a single string"""
         # Ensure analysis_result is a dict
         if dataclasses.is_dataclass(analysis_result):
             analysis_result = dataclasses.asdict(analysis_result)
 
-        self._print_header(analysis_result)
-        self._print_overall_score(analysis_result)
-        self._print_ats_analysis(analysis_result)
-        self._print_section_analysis(analysis_result)
-        self._print_keyword_analysis(analysis_result)
-        self._print_recommendations(analysis_result)
-        self._print_footer()
+        # Sections print into one buffer that is written out in a single call
+        out = io.StringIO()
+        self._print_header(analysis_result, out)
+        self._print_overall_score(analysis_result, out)
+        self._print_ats_analysis(analysis_result, out)
+        self._print_section_analysis(analysis_result, out)
+        self._print_keyword_analysis(analysis_result, out)
+        self._print_recommendations(analysis_result, out)
+        self._print_footer(out)
+        return out.getvalue()
     
     def save_report(self, analysis_result, filename: str):
         """Save report to file"""
         try:
+            report = self.render_report(analysis_result)
             with open(filename, 'w', encoding='utf-8') as f:
-                original_stdout = sys.stdout
-                sys.stdout = f
-                self.display_report(analysis_result)
-                sys.stdout = original_stdout
+                f.write(report)
         except Exception as e:
             print(f"Error saving report: {str(e)}")
     
-    def _print_header(self, analysis_result: Dict):
+    # The _print_* helpers write to out; None means sys.stdout, as with print()
+    def _print_header(self, analysis_result: Dict, out: Optional[TextIO] = None):
         """Print report header"""
-        print("=" * 80)
-        print("🎯 RESUIN - RESUME ANALYSIS REPORT")
-        print("=" * 80)
-        print(f"📅 Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"🏢 Target Company: {analysis_result['company']}")
-        print(f"📄 Resume Summary: {self._format_resume_summary(analysis_result['resume_summary'])}")
-        print("=" * 80)
-    
-    def _print_overall_score(self, analysis_result: Dict):
+        print("=" * 80, file=out)
+        print("🎯 RESUIN - RESUME ANALYSIS REPORT", file=out)
+        print("=" * 80, file=out)
+        print(f"📅 Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=out)
+        print(f"🏢 Target Company: {analysis_result['company']}", file=out)
+        print(f"📄 Resume Summary: {self._format_resume_summary(analysis_result['resume_summary'])}", file=out)
+        print("=" * 80, file=out)
+    
+    def _print_overall_score(self, analysis_result: Dict, out: Optional[TextIO] = None):
         """Print overall score section"""
         score = analysis_result['overall_score']
-        print(f"\n🏆 OVERALL RESUME SCORE: {score}/100")
-        print(self._get_score_bar(score))
-        print(f"📈 Assessment: {self._get_score_assessment(score)}")
-        print("-" * 60)
+        print(f"\n🏆 OVERALL RESUME SCORE: {score}/100", file=out)
+        print(self._get_score_bar(score), file=out)
+        print(f"📈 Assessment: {self._get_score_assessment(score)}", file=out)
+        print("-" * 60, file=out)
     
-    def _print_ats_analysis(self, analysis_result: Dict):
+    def _print_ats_analysis(self, analysis_result: Dict, out: Optional[TextIO] = None):
         """Print ATS analysis section"""
         ats = analysis_result['ats_results']
         
-        print("\n🤖 ATS SIMULATION RESULTS")
-        print("=" * 40)
-        print(f"✅ Initial Screening: {'PASS' if ats['passes_initial_screening'] else 'FAIL'}")
-        print(f"📊 ATS Score: {ats['overall_ats_score']:.1f}/100")
-        print(f"🎯 Recommendation: {ats['ats_recommendation']}")
+        print("\n🤖 ATS SIMULATION RESULTS", file=out)
+        print("=" * 40, file=out)
+        print(f"✅ Initial Screening: {'PASS' if ats['passes_initial_screening'] else 'FAIL'}", file=out)
+        print(f"📊 ATS Score: {ats['overall_ats_score']:.1f}/100", file=out)
+        print(f"🎯 Recommendation: {ats['ats_recommendation']}", file=out)
         
-        print("\n📋 Detailed ATS Breakdown:")
-        print(f"  • Keywords:    {ats['keyword_score']:.1f}/100 {self._get_mini_bar(ats['keyword_score'])}")
-        print(f"  • Experience:  {ats['experience_score']:.1f}/100 {self._get_mini_bar(ats['experience_score'])}")
-        print(f"  • Education:   {ats['education_score']:.1f}/100 {self._get_mini_bar(ats['education_score'])}")
-        print(f"  • Skills:      {ats['skills_score']:.1f}/100 {self._get_mini_bar(ats['skills_score'])}")
-        print(f"  • Format:      {ats['format_score']:.1f}/100 {self._get_mini_bar(ats['format_score'])}")
+        print("\n📋 Detailed ATS Breakdown:", file=out)
+        print(f"  • Keywords:    {ats['keyword_score']:.1f}/100 {self._get_mini_bar(ats['keyword_score'])}", file=out)
+        print(f"  • Experience:  {ats['experience_score']:.1f}/100 {self._get_mini_bar(ats['experience_score'])}", file=out)
+        print(f"  • Education:   {ats['education_score']:.1f}/100 {self._get_mini_bar(ats['education_score'])}", file=out)
+        print(f"  • Skills:      {ats['skills_score']:.1f}/100 {self._get_mini_bar(ats['skills_score'])}", file=out)
+        print(f"  • Format:      {ats['format_score']:.1f}/100 {self._get_mini_bar(ats['format_score'])}", file=out)
         
         if ats.get('company_specific_notes'):
-            print(f"\n🏢 {analysis_result['company']}-Specific Notes:")
+            print(f"\n🏢 {analysis_result['company']}-Specific Notes:", file=out)
             for note in ats['company_specific_notes']:
-                print(f"  • {note}")
+                print(f"  • {note}", file=out)
         
-        print("-" * 60)
+        print("-" * 60, file=out)
     
-    def _print_section_analysis(self, analysis_result: Dict):
+    def _print_section_analysis(self, analysis_result: Dict, out: Optional[TextIO] = None):
         """Print section-by-section analysis"""
         sections = analysis_result['section_analysis']
         
-        print("\n📑 SECTION-BY-SECTION ANALYSIS")
-        print("=" * 40)
+        print("\n📑 SECTION-BY-SECTION ANALYSIS", file=out)
+        print("=" * 40, file=out)
         
         for section_name, data in sections.items():
             status = "✅" if data['present'] else "❌"
             strength_emoji = self._get_strength_emoji(data['strength'])
             
-            print(f"\n{status} {section_name.upper()} {strength_emoji}")
-            print(f"   Status: {'Present' if data['present'] else 'Missing'}")
+            print(f"\n{status} {section_name.upper()} {strength_emoji}", file=out)
+            print(f"   Status: {'Present' if data['present'] else 'Missing'}", file=out)
             if data['present']:
-                print(f"   Strength: {data['strength']}")
-                print(f"   Word Count: {data['word_count']}")
+                print(f"   Strength: {data['strength']}", file=out)
+                print(f"   Word Count: {data['word_count']}", file=out)
             
             if data.get('suggestions'):
-                print("   💡 Suggestions:")
+                print("   💡 Suggestions:", file=out)
                 for suggestion in data['suggestions']:
-                    print(f"      • {suggestion}")
+                    print(f"      • {suggestion}", file=out)
         
-        print("-" * 60)
+        print("-" * 60, file=out)
     
-    def _print_keyword_analysis(self, analysis_result: Dict):
+    def _print_keyword_analysis(self, analysis_result: Dict, out: Optional[TextIO] = None):
         """Print keyword analysis"""
         gaps = analysis_result['keyword_gaps']
         
-        print("\n🔍 KEYWORD ANALYSIS")
-        print("=" * 40)
+        print("\n🔍 KEYWORD ANALYSIS", file=out)
+        print("=" * 40, file=out)
         
-        print(f"📈 Company Keyword Match: {gaps['keyword_match_percentage']:.1f}%")
-        print(self._get_score_bar(gaps['keyword_match_percentage']))
+        print(f"📈 Company Keyword Match: {gaps['keyword_match_percentage']:.1f}%", file=out)
+        print(self._get_score_bar(gaps['keyword_match_percentage']), file=out)
         
         if gaps.get('jd_skill_match_percentage'):
-            print(f"📈 Job Description Match: {gaps['jd_skill_match_percentage']:.1f}%")
-            print(self._get_score_bar(gaps['jd_skill_match_percentage']))
+            print(f"📈 Job Description Match: {gaps['jd_skill_match_percentage']:.1f}%", file=out)
+            print(self._get_score_bar(gaps['jd_skill_match_percentage']), file=out)
         
         if gaps['matched_company_keywords']:
-            print(f"\n✅ Found Keywords ({len(gaps['matched_company_keywords'])}):")
-            self._print_keyword_list(gaps['matched_company_keywords'])
+            print(f"\n✅ Found Keywords ({len(gaps['matched_company_keywords'])}):", file=out)
+            self._print_keyword_list(gaps['matched_company_keywords'], out)
         
         if gaps['missing_company_keywords']:
-            print(f"\n❌ Missing Keywords ({len(gaps['missing_company_keywords'])}):")
-            self._print_keyword_list(gaps['missing_company_keywords'])
+            print(f"\n❌ Missing Keywords ({len(gaps['missing_company_keywords'])}):", file=out)
+            self._print_keyword_list(gaps['missing_company_keywords'], out)
         
         if gaps.get('missing_jd_skills'):
-            print(f"\n🎯 Missing Job-Specific Skills ({len(gaps['missing_jd_skills'])}):")
-            self._print_keyword_list(gaps['missing_jd_skills'])
+            print(f"\n🎯 Missing Job-Specific Skills ({len(gaps['missing_jd_skills'])}):", file=out)
+            self._print_keyword_list(gaps['missing_jd_skills'], out)
         
-        print("-" * 60)
+        print("-" * 60, file=out)
     
-    def _print_recommendations(self, analysis_result: Dict):
+    def _print_recommendations(self, analysis_result: Dict, out: Optional[TextIO] = None):
         """Print recommendations section"""
         recommendations = analysis_result['recommendations']
         
-        print("\n💡 IMPROVEMENT RECOMMENDATIONS")
-        print("=" * 40)
+        print("\n💡 IMPROVEMENT RECOMMENDATIONS", file=out)
+        print("=" * 40, file=out)
         
-        high_priority = [r for r in recommendations if r['priority'] == 'High']
-        medium_priority = [r for r in recommendations if r['priority'] == 'Medium']
-        low_priority = [r for r in recommendations if r['priority'] == 'Low']
+        # Bucket by priority in one pass; other priority values are not shown
+        buckets = {'High': [], 'Medium': [], 'Low': []}
+        for r in recommendations:
+            bucket = buckets.get(r['priority'])
+            if bucket is not None:
+                bucket.append(r)
         
-        for priority, recs in [('HIGH PRIORITY', high_priority), 
-                              ('MEDIUM PRIORITY', medium_priority),
-                              ('LOW PRIORITY', low_priority)]:
+        for priority, recs in [('HIGH PRIORITY', buckets['High']), 
+                              ('MEDIUM PRIORITY', buckets['Medium']),
+                              ('LOW PRIORITY', buckets['Low'])]:
             if recs:
-                print(f"\n🚨 {priority}")
+                print(f"\n🚨 {priority}", file=out)
                 for i, rec in enumerate(recs, 1):
-                    print(f"\n{i}. {rec['title']} [{rec['category']}]")
-                    print(f"   📝 {rec['description']}")
-                    print("   🎯 Action Items:")
+                    print(f"\n{i}. {rec['title']} [{rec['category']}]", file=out)
+                    print(f"   📝 {rec['description']}", file=out)
+                    print("   🎯 Action Items:", file=out)
                     for action in rec['action_items']:
-                        print(f"      • {action}")
+                        print(f"      • {action}", file=out)
         
-        print("-" * 60)
+        print("-" * 60, file=out)
     
-    def _print_footer(self):
+    def _print_footer(self, out: Optional[TextIO] = None):
         """Print report footer"""
-        print("\n" + "=" * 80)
-        print("🎯 RESUIN Analysis Complete")
-        print("💡 Implement the recommendations to improve your resume score")
-        print("🚀 Good luck with your job application!")
-        print("=" * 80)
+        print("\n" + "=" * 80, file=out)
+        print("🎯 RESUIN Analysis Complete", file=out)
+        print("💡 Implement the recommendations to improve your resume score", file=out)
+        print("🚀 Good luck with your job application!", file=out)
+        print("=" * 80, file=out)
     
     def _format_resume_summary(self, summary: Dict) -> str:
         return (f"{summary['total_experience']} years exp, "
@@ -182,15 +198,19 @@ class ReportGenerator:
             return "Critical - Major overhaul needed"
     
     def _get_score_bar(self, score: float) -> str:
-        bar_length = 30
-        filled_length = int(bar_length * score / 100)
-        bar = "█" * filled_length + "░" * (bar_length - filled_length)
+        filled_length = int(_SCORE_BAR_LENGTH * score / 100)
+        if 0 <= filled_length <= _SCORE_BAR_LENGTH:
+            bar = _SCORE_BARS[filled_length]
+        else:
+            bar = "█" * filled_length + "░" * (_SCORE_BAR_LENGTH - filled_length)
         return f"[{bar}] {score:.1f}%"
     
     def _get_mini_bar(self, score: float) -> str:
-        bar_length = 10
-        filled_length = int(bar_length * score / 100)
-        bar = "█" * filled_length + "░" * (bar_length - filled_length)
+        filled_length = int(_MINI_BAR_LENGTH * score / 100)
+        if 0 <= filled_length <= _MINI_BAR_LENGTH:
+            bar = _MINI_BARS[filled_length]
+        else:
+            bar = "█" * filled_length + "░" * (_MINI_BAR_LENGTH - filled_length)
         return f"[{bar}]"
     
     def _get_strength_emoji(self, strength: str) -> str:
@@ -202,14 +222,14 @@ class ReportGenerator:
         }
         return emoji_map.get(strength, '❓')
     
-    def _print_keyword_list(self, keywords: List[str]):
+    def _print_keyword_list(self, keywords: List[str], out: Optional[TextIO] = None):
         if not keywords:
             return
         cols = 3
         for i in range(0, len(keywords), cols):
             row = keywords[i:i+cols]
             formatted_row = [f"{word:<20}" for word in row]
-            print("   " + "".join(formatted_row))
+            print("   " + "".join(formatted_row), file=out)
     
     def _load_report_template(self) -> str:
         return ""
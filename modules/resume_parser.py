@@ -5,8 +5,14 @@ Extracts and processes resume data from PDF/DOCX files, with OCR fallback.
 
 import re
 import os
+import copy
 import csv
-from typing import Dict, List, Optional
+import functools
+import hashlib
+import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 try:
     import PyPDF2
@@ -19,26 +25,100 @@ except ImportError as e:
         "Required packages not installed. Run: pip install PyPDF2 python-docx pytesseract pdf2image pillow"
     ) from e
 
+# Compiled once at import instead of looked up in the re cache on every parse
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_PHONE_RE = re.compile(r"\+?\d[\d\s-]{7,}\d")
+_LINKEDIN_RE = re.compile(r"https?://(www\.)?linkedin\.com/[A-Za-z0-9\-/]+")
+_YEAR_RE = re.compile(r"(?:20\d{2}|19\d{2})")
+
+# File types _extract_text can read
+_SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".doc")
+
+# Maximum number of parsed resumes kept by ResumeParser, keyed by file content digest
+_PARSE_CACHE_SIZE = 128
+
+# Extracted text beyond this is ignored; real resumes are far shorter, but a huge
+# scanned or generated PDF would otherwise be held and scanned in full
+_MAX_TEXT_CHARS = 200_000
+
+
+def _ocr_worker_count() -> int:
+    """Pages OCR'd at once; RESUIN_OCR_WORKERS overrides the default, e.g. for OpenMP tesseract builds."""
+    try:
+        return max(1, int(os.environ["RESUIN_OCR_WORKERS"]))
+    except (KeyError, ValueError):
+        return min(4, os.cpu_count() or 1)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_skills_csv(skills_file: str, mtime: float) -> Tuple[str, ...]:
+    """Read the skills CSV once per file version; mtime is part of the cache key."""
+    with open(skills_file, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        return tuple(row[0] for row in reader if row)
+
 
 class ResumeParser:
     def __init__(self):
+        # Assign a new list to skills_list to change the skills; in-place edits
+        # are not picked up by the skill patterns or the parse cache
         self.skills_list = self._load_skills()
-
-    def parse_resume(self, file_path: str) -> Optional[Dict]:
-        """Main entry point: parse a resume file and return structured data."""
-        text = self._extract_text(file_path)
+        self._patterned_skills: Optional[List[str]] = None
+        self._skills_version = 0
+        self._refresh_skill_patterns()
+        self._parse_cache: OrderedDict = OrderedDict()
+
+    def parse_resume(
+        self, file_path: str, max_pages: Optional[int] = None, max_chars: int = _MAX_TEXT_CHARS
+    ) -> Optional[Dict]:
+        """Main entry point: parse a resume file and return structured data.
+
+        max_pages limits how many PDF pages are read or OCR'd (None reads all);
+        max_chars bounds the text handed to the extractors.
+        """
+        # Reject unsupported files before reading them
+        if os.path.splitext(file_path)[1].lower() not in _SUPPORTED_EXTENSIONS:
+            raise ValueError("Unsupported file format")
+        with open(file_path, "rb") as f:
+            data = f.read()
+        # Reuse the parse of an identical file, e.g. the same resume submitted again,
+        # before any text extraction or OCR is done. The skills version is part of
+        # the key, so a parse made with an older skills_list is not reused.
+        self._refresh_skill_patterns()
+        key = (hashlib.blake2b(data, digest_size=16).digest(), max_pages, max_chars, self._skills_version)
+        if key in self._parse_cache:
+            self._parse_cache.move_to_end(key)
+            return self._copy_resume_data(self._parse_cache[key])
+
+        text = self._extract_text(file_path, data, max_pages)
         if not text:
             print("❌ Unable to extract text from resume.")
             return None
+        text = text[:max_chars]
 
         resume_data = self._parse_resume_text(text)
+        self._parse_cache[key] = self._copy_resume_data(resume_data)
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
         return resume_data
 
-    def _extract_text(self, file_path: str) -> str:
+    def _copy_resume_data(self, resume_data: Dict) -> Dict:
+        """Copy parsed data so cached entries are not changed by callers"""
+        return copy.deepcopy(resume_data)
+
+    def _refresh_skill_patterns(self) -> None:
+        """Rebuild the skill patterns and bump the skills version after skills_list is reassigned."""
+        if self.skills_list is not self._patterned_skills:
+            # (lowercase, original) pairs so skills are not lowercased on every parse
+            self._skill_patterns = tuple((skill.lower(), skill) for skill in self.skills_list)
+            self._patterned_skills = self.skills_list
+            self._skills_version += 1
+
+    def _extract_text(self, file_path: str, data: bytes, max_pages: Optional[int] = None) -> str:
         """Extract raw text from PDF or DOCX, with OCR fallback."""
         ext = os.path.splitext(file_path)[1].lower()
         if ext == ".pdf":
-            text = self._extract_pdf_text(file_path)
+            text = self._extract_pdf_text(data, max_pages)
         elif ext in (".docx", ".doc"):
             text = self._extract_docx_text(file_path)
         else:
@@ -46,30 +126,33 @@ class ResumeParser:
 
         if not text.strip():
             # Fallback to OCR if text extraction failed
-            text = self._ocr_pdf(file_path) if ext == ".pdf" else ""
+            text = self._ocr_pdf(file_path, max_pages) if ext == ".pdf" else ""
         return text
 
-    def _extract_pdf_text(self, file_path: str) -> str:
-        """Extract text from PDF using PyPDF2."""
-        text = ""
-        with open(file_path, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                text += page.extract_text() or ""
-        return text
+    def _extract_pdf_text(self, data: bytes, max_pages: Optional[int] = None) -> str:
+        """Extract text from PDF bytes using PyPDF2."""
+        # Parse from memory; PyPDF2 otherwise issues many small seeks and reads
+        # against the file while walking the xref table and page streams
+        reader = PyPDF2.PdfReader(io.BytesIO(data))
+        # Join the pages once instead of growing a string page by page
+        return "".join(page.extract_text() or "" for page in reader.pages[:max_pages])
 
     def _extract_docx_text(self, file_path: str) -> str:
         """Extract text from DOCX using python-docx."""
         doc = docx.Document(file_path)
         return "\n".join(para.text for para in doc.paragraphs)
 
-    def _ocr_pdf(self, file_path: str) -> str:
+    def _ocr_pdf(self, file_path: str, max_pages: Optional[int] = None) -> str:
         """Perform OCR on each page of the PDF."""
-        text = ""
-        images = convert_from_path(file_path)
-        for img in images:
-            text += pytesseract.image_to_string(img)
-        return text
+        # Pages past max_pages are never rasterized, which is most of the OCR cost
+        images = convert_from_path(file_path, first_page=1, last_page=max_pages)
+        if len(images) <= 1:
+            return "".join(pytesseract.image_to_string(img) for img in images)
+        # Each OCR call runs its own tesseract process, so threads are enough to
+        # OCR pages in parallel. Read per call so RESUIN_OCR_WORKERS can change.
+        workers = _ocr_worker_count()
+        with ThreadPoolExecutor(max_workers=min(workers, len(images))) as pool:
+            return "".join(pool.map(pytesseract.image_to_string, images))
 
     def _parse_resume_text(self, text: str) -> Dict:
         """Parse extracted text into structured resume data."""
@@ -82,9 +165,9 @@ class ResumeParser:
 
     def _extract_contact_info(self, text: str) -> Dict:
         """Extract phone, email, LinkedIn, etc."""
-        email = re.findall(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
-        phone = re.findall(r"\+?\d[\d\s-]{7,}\d", text)
-        linkedin = re.findall(r"https?://(www\.)?linkedin\.com/[A-Za-z0-9\-/]+", text)
+        email = _EMAIL_RE.findall(text)
+        phone = _PHONE_RE.findall(text)
+        linkedin = _LINKEDIN_RE.findall(text)
         return {
             "emails": email,
             "phones": phone,
@@ -93,16 +176,14 @@ class ResumeParser:
 
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text based on a predefined list."""
-        found_skills = []
         text_lower = text.lower()
-        for skill in self.skills_list:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        return list(set(found_skills))
+        found_skills = [skill for skill_lower, skill in self._skill_patterns if skill_lower in text_lower]
+        # Drop duplicates, keeping the skills-list order
+        return list(dict.fromkeys(found_skills))
 
     def _estimate_experience(self, text: str) -> int:
         """Estimate years of experience from date ranges."""
-        years = re.findall(r"(20\d{2}|19\d{2})", text)
+        years = _YEAR_RE.findall(text)
         if years:
             years = sorted(set(map(int, years)))
             return max(0, max(years) - min(years))
@@ -110,34 +191,34 @@ class ResumeParser:
 
     def _detect_sections(self, text: str) -> Dict[str, str]:
         """Detect common resume sections."""
-        sections = {
-            "experience": "",
-            "education": "",
-            "skills": "",
-            "projects": "",
-            "certifications": "",
+        # Lines are collected per section and joined once at the end
+        section_lines = {
+            "experience": [],
+            "education": [],
+            "skills": [],
+            "projects": [],
+            "certifications": [],
         }
         # This is a naive section detection — can be improved with NLP
         lines = text.splitlines()
-        current_section = None
+        current_lines = None
         for line in lines:
             line_clean = line.strip().lower()
-            for section in sections.keys():
+            for section, content in section_lines.items():
                 if section in line_clean:
-                    current_section = section
+                    current_lines = content
                     break
             else:
-                if current_section:
-                    sections[current_section] += line + "\n"
-        return sections
+                if current_lines is not None:
+                    current_lines.append(line)
+        return {section: "\n".join(content) + "\n" if content else ""
+                for section, content in section_lines.items()}
 
     def _load_skills(self) -> List[str]:
         """Load skills from CSV file or use default list."""
         skills_file = os.path.join(os.path.dirname(__file__), "data", "skills.csv")
         if os.path.exists(skills_file):
-            with open(skills_file, newline="", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                return [row[0] for row in reader if row]
+            return list(_read_skills_csv(skills_file, os.path.getmtime(skills_file)))
         else:
             return ["Python", "Java", "C++", "SQL", "JavaScript", "HTML", "CSS"]
 